@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+""" qrencoder.py
+    Minimal pure python QR code encoder used for sharing wifi networks.
+    Byte mode only, versions 1-40, all four error correction levels.
+    Adapted from the QR Code generator library by Project Nayuki (MIT License)
+    https://www.nayuki.io/page/qr-code-generator-library
+    Creation date: 19-10-2026
+    Modified date: 19-10-2026
+    Dependencies: none
+"""
+
+# QR Code generator library (Python)
+#
+# Copyright (c) Project Nayuki. (MIT License)
+# https://www.nayuki.io/page/qr-code-generator-library
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+# - The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+# - The Software is provided "as is", without warranty of any kind, express or
+#   implied, including but not limited to the warranties of merchantability,
+#   fitness for a particular purpose and noninfringement. In no event shall the
+#   authors or copyright holders be liable for any claim, damages or other
+#   liability, whether in an action of contract, tort or otherwise, arising from,
+#   out of or in connection with the Software or the use or other dealings in the
+#   Software.
+
+__copyright__ = "Copyright (c) Project Nayuki"
+__licence__ = "MIT"
+
+# error correction level -> (index into the tables below, format bits)
+ECC_LEVELS = {'L': (0, 1), 'M': (1, 0), 'Q': (2, 3), 'H': (3, 2)}
+
+# ecc codewords per block, indexed by [level][version]. index 0 is unused.
+ECC_CODEWORDS_PER_BLOCK = [
+    [-1, 7, 10, 15, 20, 26, 18, 20, 24, 30, 18, 20, 24, 26, 30, 22, 24, 28, 30, 28, 28,
+     28, 28, 30, 30, 26, 28, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30],
+    [-1, 10, 16, 26, 18, 24, 16, 18, 22, 22, 26, 30, 22, 22, 24, 24, 28, 28, 26, 26, 26,
+     26, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28],
+    [-1, 13, 22, 18, 26, 18, 24, 18, 22, 20, 24, 28, 26, 24, 20, 30, 24, 28, 28, 26, 30,
+     28, 30, 30, 30, 30, 28, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30],
+    [-1, 17, 28, 22, 16, 22, 28, 26, 26, 24, 28, 24, 28, 22, 24, 24, 30, 28, 28, 26, 28,
+     30, 24, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30],
+]
+
+# number of error correction blocks, indexed by [level][version]. index 0 is unused.
+NUM_ERROR_CORRECTION_BLOCKS = [
+    [-1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 4, 4, 4, 4, 4, 6, 6, 6, 6, 7, 8,
+     8, 9, 9, 10, 12, 12, 12, 13, 14, 15, 16, 17, 18, 19, 19, 20, 21, 22, 24, 25],
+    [-1, 1, 1, 1, 2, 2, 4, 4, 4, 5, 5, 5, 8, 9, 9, 10, 10, 11, 13, 14, 16,
+     17, 17, 18, 20, 21, 23, 25, 26, 28, 29, 31, 33, 35, 37, 38, 40, 43, 45, 47, 49],
+    [-1, 1, 1, 2, 2, 4, 4, 6, 6, 8, 8, 8, 10, 12, 16, 12, 17, 16, 18, 21, 20,
+     23, 23, 25, 27, 29, 34, 34, 35, 38, 40, 43, 45, 48, 51, 53, 56, 59, 62, 65, 68],
+    [-1, 1, 1, 2, 4, 4, 4, 5, 6, 8, 8, 11, 11, 16, 16, 18, 16, 19, 21, 25, 25,
+     25, 34, 30, 32, 35, 37, 40, 42, 45, 48, 51, 54, 57, 60, 63, 66, 70, 74, 77, 81],
+]
+
+MASK_PATTERNS = [
+    lambda x, y: (x + y) % 2 == 0,
+    lambda x, y: y % 2 == 0,
+    lambda x, y: x % 3 == 0,
+    lambda x, y: (x + y) % 3 == 0,
+    lambda x, y: (x // 3 + y // 2) % 2 == 0,
+    lambda x, y: x * y % 2 + x * y % 3 == 0,
+    lambda x, y: (x * y % 2 + x * y % 3) % 2 == 0,
+    lambda x, y: ((x + y) % 2 + x * y % 3) % 2 == 0,
+]
+
+
+class QRCodeError(ValueError):
+    """
+    raised when the data does not fit in a QR code.
+    """
+
+
+def encode(data, ecc='M') -> list:
+    """
+    encodes the data as a QR code in byte mode.\n
+    data can be str (encoded as utf-8) or bytes.\n
+    returns the module matrix as a list of rows, True for dark modules.
+    The quiet zone is not included.
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    level, _ = ECC_LEVELS[ecc]
+
+    for version in range(1, 41):
+        count_bits = 8 if version <= 9 else 16
+        capacity_bits = num_data_codewords(version, level) * 8
+        if len(data) < (1 << count_bits) and 4 + count_bits + len(data) * 8 <= capacity_bits:
+            break
+    else:
+        raise QRCodeError(f'data too long for a QR code ({len(data)} bytes)')
+
+    # mode indicator, character count, data, terminator and padding
+    bits = []
+    append_bits(bits, 0b0100, 4)
+    append_bits(bits, len(data), count_bits)
+    for byte in data:
+        append_bits(bits, byte, 8)
+    bits.extend([0] * min(4, capacity_bits - len(bits)))
+    bits.extend([0] * (-len(bits) % 8))
+    codewords = [int(''.join(map(str, bits[i:i + 8])), 2) for i in range(0, len(bits), 8)]
+    pad = 0xEC
+    while len(codewords) < capacity_bits // 8:
+        codewords.append(pad)
+        pad ^= 0xEC ^ 0x11
+
+    return QRMatrix(version, ecc).build(add_ecc_and_interleave(codewords, version, level))
+
+
+def append_bits(bits, value, length):
+    bits.extend((value >> i) & 1 for i in reversed(range(length)))
+
+
+def num_raw_data_modules(version) -> int:
+    """
+    number of modules available for data and ecc codewords in the given version.
+    """
+    result = (16 * version + 128) * version + 64
+    if version >= 2:
+        num_align = version // 7 + 2
+        result -= (25 * num_align - 10) * num_align - 55
+        if version >= 7:
+            result -= 36
+    return result
+
+
+def num_data_codewords(version, level) -> int:
+    return (num_raw_data_modules(version) // 8
+            - ECC_CODEWORDS_PER_BLOCK[level][version] * NUM_ERROR_CORRECTION_BLOCKS[level][version])
+
+
+def alignment_pattern_positions(version) -> list:
+    if version == 1:
+        return []
+    num_align = version // 7 + 2
+    size = version * 4 + 17
+    step = (version * 8 + num_align * 3 + 5) // (num_align * 4 - 4) * 2
+    return [6] + sorted(size - 7 - i * step for i in range(num_align - 1))
+
+
+def add_ecc_and_interleave(data, version, level) -> list:
+    """
+    splits the data codewords into blocks, appends the reed-solomon ecc to
+    each block and interleaves the blocks into the final codeword sequence.
+    """
+    num_blocks = NUM_ERROR_CORRECTION_BLOCKS[level][version]
+    block_ecc_len = ECC_CODEWORDS_PER_BLOCK[level][version]
+    raw_codewords = num_raw_data_modules(version) // 8
+    num_short_blocks = num_blocks - raw_codewords % num_blocks
+    short_block_len = raw_codewords // num_blocks
+
+    divisor = reed_solomon_divisor(block_ecc_len)
+    blocks = []
+    k = 0
+    for i in range(num_blocks):
+        data_len = short_block_len - block_ecc_len + (0 if i < num_short_blocks else 1)
+        block = data[k:k + data_len]
+        k += data_len
+        ecc = reed_solomon_remainder(block, divisor)
+        if i < num_short_blocks:
+            # placeholder so all blocks are the same length, skipped below
+            block.append(0)
+        blocks.append(block + ecc)
+
+    result = []
+    for i in range(len(blocks[0])):
+        for j, block in enumerate(blocks):
+            if i != short_block_len - block_ecc_len or j >= num_short_blocks:
+                result.append(block[i])
+    return result
+
+
+def gf_multiply(x, y) -> int:
+    """
+    multiplication in GF(2^8) modulo x^8 + x^4 + x^3 + x^2 + 1.
+    """
+    z = 0
+    for i in reversed(range(8)):
+        z = (z << 1) ^ ((z >> 7) * 0x11D)
+        z ^= ((y >> i) & 1) * x
+    return z
+
+
+def reed_solomon_divisor(degree) -> list:
+    result = [0] * (degree - 1) + [1]
+    root = 1
+    for _ in range(degree):
+        for j in range(degree):
+            result[j] = gf_multiply(result[j], root)
+            if j + 1 < degree:
+                result[j] ^= result[j + 1]
+        root = gf_multiply(root, 0x02)
+    return result
+
+
+def reed_solomon_remainder(data, divisor) -> list:
+    result = [0] * len(divisor)
+    for byte in data:
+        factor = byte ^ result.pop(0)
+        result.append(0)
+        for i, coef in enumerate(divisor):
+            result[i] ^= gf_multiply(coef, factor)
+    return result
+
+
+class QRMatrix:
+    """
+    module matrix for a single QR code symbol.
+    """
+
+    def __init__(self, version, ecc):
+        self.version = version
+        self.ecc = ecc
+        self.size = version * 4 + 17
+        self.modules = [[False] * self.size for _ in range(self.size)]
+        self.is_function = [[False] * self.size for _ in range(self.size)]
+
+
+    def build(self, codewords) -> list:
+        self.draw_function_patterns()
+        self.draw_codewords(codewords)
+
+        # try every mask and keep the one with the lowest penalty
+        best_mask, best_penalty = 0, None
+        for mask in range(8):
+            self.apply_mask(mask)
+            self.draw_format_bits(mask)
+            penalty = self.penalty_score()
+            if best_penalty is None or penalty < best_penalty:
+                best_mask, best_penalty = mask, penalty
+            self.apply_mask(mask)  # xor again to undo
+
+        self.apply_mask(best_mask)
+        self.draw_format_bits(best_mask)
+        return self.modules
+
+
+    def set_function_module(self, x, y, dark):
+        self.modules[y][x] = dark
+        self.is_function[y][x] = True
+
+
+    def draw_function_patterns(self):
+        size = self.size
+        for i in range(size):
+            self.set_function_module(6, i, i % 2 == 0)
+            self.set_function_module(i, 6, i % 2 == 0)
+
+        self.draw_finder_pattern(3, 3)
+        self.draw_finder_pattern(size - 4, 3)
+        self.draw_finder_pattern(3, size - 4)
+
+        positions = alignment_pattern_positions(self.version)
+        last = len(positions) - 1
+        for i, x in enumerate(positions):
+            for j, y in enumerate(positions):
+                # skip the three corners occupied by the finder patterns
+                if (i, j) not in ((0, 0), (0, last), (last, 0)):
+                    self.draw_alignment_pattern(x, y)
+
+        # reserve the format area, the real bits are drawn after masking
+        self.draw_format_bits(0)
+        self.draw_version()
+
+
+    def draw_finder_pattern(self, x, y):
+        for dy in range(-4, 5):
+            for dx in range(-4, 5):
+                xx, yy = x + dx, y + dy
+                if 0 <= xx < self.size and 0 <= yy < self.size:
+                    self.set_function_module(xx, yy, max(abs(dx), abs(dy)) not in (2, 4))
+
+
+    def draw_alignment_pattern(self, x, y):
+        for dy in range(-2, 3):
+            for dx in range(-2, 3):
+                self.set_function_module(x + dx, y + dy, max(abs(dx), abs(dy)) != 1)
+
+
+    def draw_format_bits(self, mask):
+        data = ECC_LEVELS[self.ecc][1] << 3 | mask
+        rem = data
+        for _ in range(10):
+            rem = (rem << 1) ^ ((rem >> 9) * 0x537)
+        bits = (data << 10 | rem) ^ 0x5412
+        bit = lambda i: (bits >> i) & 1 != 0
+
+        # first copy, around the top left finder
+        for i in range(0, 6):
+            self.set_function_module(8, i, bit(i))
+        self.set_function_module(8, 7, bit(6))
+        self.set_function_module(8, 8, bit(7))
+        self.set_function_module(7, 8, bit(8))
+        for i in range(9, 15):
+            self.set_function_module(14 - i, 8, bit(i))
+
+        # second copy, split between the other two finders
+        size = self.size
+        for i in range(0, 8):
+            self.set_function_module(size - 1 - i, 8, bit(i))
+        for i in range(8, 15):
+            self.set_function_module(8, size - 15 + i, bit(i))
+        self.set_function_module(8, size - 8, True)  # always dark
+
+
+    def draw_version(self):
+        if self.version < 7:
+            return
+        rem = self.version
+        for _ in range(12):
+            rem = (rem << 1) ^ ((rem >> 11) * 0x1F25)
+        bits = self.version << 12 | rem
+        for i in range(18):
+            dark = (bits >> i) & 1 != 0
+            a = self.size - 11 + i % 3
+            b = i // 3
+            self.set_function_module(a, b, dark)
+            self.set_function_module(b, a, dark)
+
+
+    def draw_codewords(self, codewords):
+        """
+        places the codewords in the two module wide zigzag from the bottom right.
+        """
+        size = self.size
+        total_bits = len(codewords) * 8
+        i = 0
+        right = size - 1
+        while right >= 1:
+            if right == 6:
+                # skip the vertical timing pattern
+                right = 5
+            upward = ((right + 1) & 2) == 0
+            for vert in range(size):
+                y = size - 1 - vert if upward else vert
+                for x in (right, right - 1):
+                    if not self.is_function[y][x] and i < total_bits:
+                        self.modules[y][x] = (codewords[i >> 3] >> (7 - (i & 7))) & 1 != 0
+                        i += 1
+            right -= 2
+
+
+    def apply_mask(self, mask):
+        pattern = MASK_PATTERNS[mask]
+        for y in range(self.size):
+            row = self.modules[y]
+            is_function = self.is_function[y]
+            for x in range(self.size):
+                if not is_function[x] and pattern(x, y):
+                    row[x] = not row[x]
+
+
+    def penalty_score(self) -> int:
+        """
+        penalty score for the current mask, lower is better.
+        """
+        size = self.size
+        rows = [''.join('1' if m else '0' for m in row) for row in self.modules]
+        columns = [''.join(row[x] for row in rows) for x in range(size)]
+        result = 0
+
+        for line in rows + columns:
+            # runs of five or more modules of the same colour
+            run = 1
+            for i in range(1, size + 1):
+                if i < size and line[i] == line[i - 1]:
+                    run += 1
+                else:
+                    if run >= 5:
+                        result += run - 2
+                    run = 1
+            # finder like patterns with four light modules either side
+            padded = '0000' + line + '0000'
+            for pattern in ('10111010000', '00001011101'):
+                start = padded.find(pattern)
+                while start != -1:
+                    result += 40
+                    start = padded.find(pattern, start + 1)
+
+        # 2x2 blocks of the same colour
+        for y in range(size - 1):
+            for x in range(size - 1):
+                colour = rows[y][x]
+                if colour == rows[y][x + 1] == rows[y + 1][x] == rows[y + 1][x + 1]:
+                    result += 3
+
+        # balance of dark and light modules
+        dark = sum(line.count('1') for line in rows)
+        total = size * size
+        result += ((abs(dark * 20 - total * 10) + total - 1) // total - 1) * 10
+        return result
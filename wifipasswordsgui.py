@@ -34,19 +34,30 @@ import os
 import sys
 import json
 import locale
+import time
+import bisect
+import logging
+import threading
+import traceback
+from collections import OrderedDict
 from datetime import datetime
 import platform
-from PyQt5.QtWidgets import (QCheckBox, QComboBox, QDialog, QFileDialog, QFrame, QGridLayout, QHBoxLayout, QLabel, QLineEdit, QApplication, QMessageBox, 
-                            QPushButton, QTextEdit, QTableWidget, QTableWidgetItem, QVBoxLayout, QStyleFactory)
-from PyQt5.QtGui import QColor, QIcon, QPalette
-from PyQt5.QtCore import Qt, QThread, QObject,pyqtSignal
+from PyQt5.QtWidgets import (QAction, QCheckBox, QComboBox, QDialog, QFileDialog, QFrame, QGridLayout, QHBoxLayout, QLabel, QLineEdit, 
+                            QApplication, QMessageBox, QPushButton, QTextEdit, QTableWidget, QTableWidgetItem, QVBoxLayout, QStyleFactory)
+from PyQt5.QtGui import QColor, QFont, QFontDatabase, QIcon, QImage, QPageSize, QPainter, QPalette, QPdfWriter, QPen, QPixmap
+from PyQt5.QtCore import Qt, QRect, QThread, QObject, QTimer, pyqtSignal
+
+import qrencoder
+
+logger = logging.getLogger(__name__)
 
 ############################ CLASSES ############################
 
 class WifiPasswordsGUI(QDialog):
-    def __init__(self, data=None, parent=None):
+    def __init__(self, data=None, parent=None, watchdog=None):
         super().__init__(parent)
         
+        self.watchdog = watchdog
         self.original_palette = QApplication.palette()
         QApplication.setStyle(QStyleFactory.create('fusion'))
         QApplication.setPalette(self.original_palette)
@@ -72,6 +83,9 @@ class WifiPasswordsGUI(QDialog):
         else:
             self.data = data
 
+        # LRU cache of the QR codes rendered for the share dialog
+        self.qr_cache = QRPixmapCache()
+
         self.create_table_group()
         self.run_get_data_thread()
 
@@ -113,6 +127,16 @@ class WifiPasswordsGUI(QDialog):
     def create_table_group(self):
         self.table_group = QFrame()
         self.table = TableView(self.data,self.dark_mode)
+
+        self.share_action = QAction('Share network..', self.table)
+        self.share_action.triggered.connect(self.share_on_click)
+        self.share_cards_action = QAction('Save share cards for selection..', self.table)
+        self.share_cards_action.triggered.connect(self.share_cards_on_click)
+        self.table.setContextMenuPolicy(Qt.ActionsContextMenu)
+        self.table.addAction(self.share_action)
+        self.table.addAction(self.share_cards_action)
+        self.table.itemSelectionChanged.connect(self.update_share_action)
+
         layout = QVBoxLayout()
         layout.addWidget(self.table)
         self.table_group.setLayout(layout)
@@ -132,6 +156,9 @@ class WifiPasswordsGUI(QDialog):
         self.save_data_button = QPushButton('Save to file..')
         self.save_data_button.clicked.connect(self.save_data_on_click)
 
+        self.share_button = QPushButton('Share..')
+        self.share_button.clicked.connect(self.share_button_on_click)
+
         self.dns_button = QPushButton('Current DNS config')
         self.dns_button.clicked.connect(self.dns_button_on_click)
 
@@ -142,6 +169,7 @@ class WifiPasswordsGUI(QDialog):
         layout.addWidget(self.currently_visible_button)
         layout.addWidget(self.dns_button)
         layout.addWidget(self.save_data_button)
+        layout.addWidget(self.share_button)
         layout.addWidget(self.settings_button)
         layout.addWidget(self.exit_button)
         self.button_group.setLayout(layout)
@@ -151,6 +179,17 @@ class WifiPasswordsGUI(QDialog):
         self.currently_visible_button.setDisabled(disabled)
         self.dns_button.setDisabled(disabled)
         self.save_data_button.setDisabled(disabled)
+        self.share_button.setDisabled(disabled)
+        self.share_cards_action.setDisabled(disabled)
+        self.update_share_action()
+
+
+    def update_share_action(self):
+        """
+        the context menu share action is for a single network only.
+        """
+        enabled = self.share_button.isEnabled() and len(self.table.selected_networks()) == 1
+        self.share_action.setEnabled(enabled)
 
 
     def currently_visible_on_click(self):
@@ -174,8 +213,83 @@ class WifiPasswordsGUI(QDialog):
         dia.exec_()
 
 
+    def share_button_on_click(self):
+        """
+        shows the QR code for a single selected network, or saves
+        share cards if more than one network is selected.
+        """
+        if len(self.table.selected_networks()) > 1:
+            self.share_cards_on_click()
+        else:
+            self.share_on_click()
+
+
+    def share_on_click(self):
+        networks = self.table.selected_networks()
+        if len(networks) != 1:
+            self.show_alert('Select a single network to share.')
+            return
+        network = networks[0]
+        dia = ShareNetworkDialog(self, network, self.table.data[network], self.qr_cache)
+        if self.dark_mode:
+            self.set_dark_palette(dia)
+        dia.exec_()
+
+
+    def share_cards_on_click(self):
+        networks = self.table.selected_networks()
+        if not networks:
+            self.show_alert('Select one or more networks to share.')
+            return
+        default_path = os.path.join(os.path.expanduser('~'), 'wifi_share_cards.pdf')
+        path, _ = QFileDialog.getSaveFileName(self, 'Save share cards', default_path, 'PDF (*.pdf)')
+        if not path:
+            return
+        self.run_share_cards_thread(path, [(network, self.table.data[network]) for network in networks])
+
+
+    def run_share_cards_thread(self, path, networks):
+        """
+        render the share cards and write the PDF in a separate thread,
+        only the result alert is shown on the GUI thread.
+        """
+        self.buttons_disabled(True)
+        self.cards_thread = QThread()
+        self.cards_worker = ShareCardsWorker(path, networks)
+        self.cards_worker.moveToThread(self.cards_thread)
+        self.cards_thread.started.connect(self.cards_worker.run)
+        self.cards_worker.result_sig.connect(lambda ok, num_written: self.share_cards_saved(path, ok, num_written, len(networks)))
+        self.cards_worker.result_sig.connect(self.cards_thread.quit)
+        self.cards_thread.start()
+
+
+    def share_cards_saved(self, path, ok, num_written, num_selected):
+        """
+        callback for the share cards worker, always called so the buttons are re-enabled.
+        """
+        self.buttons_disabled(False)
+        if not ok:
+            self.show_alert(f'Could not write share cards to {path}!')
+            return
+        if not num_written:
+            self.show_alert('None of the selected networks can be shared as a QR code.')
+            return
+        message = f'{num_written} share cards saved!\nPath: {path}'
+        if num_written < num_selected:
+            message += f'\n{num_selected - num_written} networks were skipped as they cannot be shared as a QR code.'
+        self.show_alert(message)
+
+
+    def show_alert(self, text):
+        alert = QMessageBox(self)
+        alert.setText(text)
+        if self.dark_mode:
+            self.set_dark_palette(alert)
+        alert.exec_()
+
+
     def settings_and_about_on_click(self):
-        dia = SettingsAndAboutDialog(self)
+        dia = SettingsAndAboutDialog(self, self.watchdog)
         if self.dark_mode:
             self.set_dark_palette(dia)
         dia.exec_()
@@ -284,6 +398,8 @@ class TableView(QTableWidget):
                 font_color = Qt.blue
 
             net_formatted = QTableWidgetItem(network)
+            # the cell text can be edited, so keep the real ssid for lookups
+            net_formatted.setData(Qt.UserRole, network)
             auth_formatted = QTableWidgetItem(values['auth'])
             psk_formatted = QTableWidgetItem(values['psk'])
             metered_formatted = QTableWidgetItem(is_metered)
@@ -306,12 +422,20 @@ class TableView(QTableWidget):
         self.setSortingEnabled(True)
 
 
+    def selected_networks(self) -> list:
+        """
+        returns the network names of the rows with any selected cell, in table order.
+        """
+        rows = sorted({index.row() for index in self.selectedIndexes()})
+        return [self.item(row, 0).data(Qt.UserRole) for row in rows]
+
+
 class SettingsAndAboutDialog(QDialog):
     """
     settings and about dialog. \n
     """
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, watchdog=None):
         super().__init__(parent)
 
         self.resize(200, 50)
@@ -332,6 +456,19 @@ class SettingsAndAboutDialog(QDialog):
         layout.addWidget(self.wifipasswords_version_label)
         layout.addWidget(self.gui_version_label)
         layout.addWidget(self.webpage_label)
+
+        # stall summary is only available when started with --watchdog
+        if watchdog is not None:
+            self.resize(600, 400)
+            self.watchdog_label = QLabel("Event loop watchdog:")
+            watchdog_text_box = QTextEdit()
+            watchdog_text_box.setReadOnly(True)
+            watchdog_text_box.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+            watchdog_text_box.setPlainText(watchdog.summary())
+            layout.addSpacing(10)
+            layout.addWidget(self.watchdog_label)
+            layout.addWidget(watchdog_text_box)
+
         layout.addSpacing(10)
         layout.addWidget(close_button)
         self.setLayout(layout)
@@ -642,6 +779,48 @@ class DNSDialog(QDialog):
         self.setLayout(layout)
 
 
+class ShareNetworkDialog(QDialog):
+    """
+    dialog showing a scannable WIFI: QR code for a single network.\n
+    the QR code is only rendered when the dialog is opened, and is taken
+    from the cache if the network has been shared before.
+    """
+    def __init__(self, parent, network, values, qr_cache):
+        super().__init__(parent)
+
+        self.resize(400, 500)
+        self.setWindowTitle(f'Share {network}')
+
+        layout = QVBoxLayout()
+
+        self.network_label = QLabel(f'Network: {network}')
+        self.auth_label = QLabel(f'Security: {values["auth"].strip() or "Unknown"}')
+        self.psk_label = QLabel(f'Password: {values["psk"]}')
+        self.psk_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+
+        self.qr_label = QLabel()
+        self.qr_label.setAlignment(Qt.AlignCenter)
+        payload = wifi_qr_payload(network, values['auth'], values['psk'])
+        if payload is None:
+            _, reason = wifi_qr_security(values['auth'], values['psk'])
+            self.qr_label.setText(reason)
+            self.qr_label.setWordWrap(True)
+        else:
+            self.qr_label.setPixmap(qr_cache.get(payload))
+
+        close_button = QPushButton('Close')
+        close_button.clicked.connect(self.accept)
+
+        layout.addWidget(self.network_label)
+        layout.addWidget(self.auth_label)
+        layout.addWidget(self.psk_label)
+        layout.addSpacing(10)
+        layout.addWidget(self.qr_label)
+        layout.addSpacing(10)
+        layout.addWidget(close_button)
+        self.setLayout(layout)
+
+
 class GetDataWorker(QObject):
     finished_sig = pyqtSignal()
     data_sig = pyqtSignal(dict,list)
@@ -659,6 +838,363 @@ class GetDataWorker(QObject):
         # self.finished_sig.emit()
 
 
+class ShareCardsWorker(QObject):
+    """
+    renders printable share cards for a list of (network, values) and saves
+    them as a PDF. networks that cannot be shared as a QR code are skipped.\n
+    result_sig is always emitted with (ok, number of cards written), even if
+    rendering fails, so the GUI can re-enable its buttons.
+    """
+    result_sig = pyqtSignal(bool, int)
+
+    def __init__(self, path, networks):
+        super().__init__()
+        self.path = path
+        self.networks = networks
+
+    def run(self):
+        # rendered one after another - the encoder is pure python so a thread
+        # pool would not run in parallel, this only keeps the GUI thread free.
+        ok, num_written = False, 0
+        try:
+            cards = [render_share_card(network, values) for network, values in self.networks]
+            cards = [card for card in cards if card is not None]
+            ok = write_share_cards_pdf(self.path, cards) if cards else True
+            num_written = len(cards) if ok else 0
+        except Exception:
+            logger.exception('Failed to save share cards to %s', self.path)
+            ok = False
+        self.result_sig.emit(ok, num_written)
+
+
+class QRPixmapCache:
+    """
+    size bounded LRU cache of rendered QR code pixmaps, keyed by payload.\n
+    QPixmap can only be used on the GUI thread, so the cache is not thread safe.
+    """
+    def __init__(self, max_entries=32, size=300):
+        self.max_entries = max_entries
+        self.size = size
+        self.pixmaps = OrderedDict()
+
+    def get(self, payload) -> QPixmap:
+        if payload in self.pixmaps:
+            self.pixmaps.move_to_end(payload)
+            return self.pixmaps[payload]
+
+        pixmap = QPixmap.fromImage(qr_image(payload, self.size))
+        self.pixmaps[payload] = pixmap
+        while len(self.pixmaps) > self.max_entries:
+            self.pixmaps.popitem(last=False)
+        return pixmap
+
+
+class EventLoopWatchdog(QObject):
+    """
+    opt-in responsiveness watchdog for the GUI thread, enabled with --watchdog.\n
+    a heartbeat QTimer on the GUI thread stamps the time on each tick and a side
+    thread checks the stamp. if the event loop is blocked past the threshold the
+    GUI thread stack is captured and logged straight away, so hangs that never
+    recover are still reported. once the loop recovers the final duration is
+    logged and added to the summary shown in the about dialog.
+    """
+    # upper bounds (ms) of the histogram buckets, the last bucket is open ended.
+    histogram_bounds_ms = [500, 1000, 2000, 5000, 10000]
+
+    def __init__(self, interval_ms=50, threshold_ms=250, parent=None):
+        super().__init__(parent)
+
+        self.interval = interval_ms / 1000
+        self.threshold = threshold_ms / 1000
+        self.main_thread_id = threading.get_ident()
+        self.lock = threading.Lock()
+        self.running = False
+        self.monitor_thread = None
+
+        self.last_beat = time.monotonic()
+        self.pending_stack = None
+
+        # stalls are kept as aggregates so a long session does not grow without limit.
+        self.bounds_ms = [bound for bound in self.histogram_bounds_ms if bound > threshold_ms]
+        self.histogram = [0] * (len(self.bounds_ms) + 1)
+        self.stall_count = 0
+        self.total_stalled = 0
+        self.worst_stall = 0
+        # location -> (count, total seconds, worst seconds)
+        self.by_location = {}
+
+        self.heartbeat_timer = QTimer(self)
+        self.heartbeat_timer.setInterval(interval_ms)
+        self.heartbeat_timer.timeout.connect(self.heartbeat)
+
+
+    def start(self):
+        """
+        start the heartbeat and the monitor thread. must be called from the GUI thread.
+        """
+        if self.running:
+            return
+        self.last_beat = time.monotonic()
+        self.pending_stack = None
+        self.running = True
+        self.heartbeat_timer.start()
+        self.monitor_thread = threading.Thread(target=self.monitor, name='EventLoopWatchdog', daemon=True)
+        self.monitor_thread.start()
+
+
+    def stop(self):
+        self.running = False
+        self.heartbeat_timer.stop()
+        if self.monitor_thread is not None:
+            self.monitor_thread.join()
+            self.monitor_thread = None
+
+
+    def heartbeat(self):
+        """
+        runs on the GUI thread. any time between beats beyond the timer interval
+        was spent with the event loop unable to service the timer.
+        """
+        now = time.monotonic()
+        with self.lock:
+            stalled = now - self.last_beat - self.interval
+            self.last_beat = now
+            stack = self.pending_stack
+            self.pending_stack = None
+        if stalled >= self.threshold:
+            self.record_stall(stalled, stack)
+
+
+    def monitor(self):
+        """
+        runs on the side thread. captures and logs the GUI thread stack once per stall.
+        """
+        while self.running:
+            time.sleep(self.interval)
+            with self.lock:
+                beat = self.last_beat
+                blocked = time.monotonic() - beat - self.interval
+                if blocked < self.threshold or self.pending_stack is not None:
+                    continue
+
+            frame = sys._current_frames().get(self.main_thread_id)
+            stack = traceback.extract_stack(frame) if frame is not None else []
+            del frame
+
+            with self.lock:
+                # only keep the stack if the loop is still in the same stall.
+                if self.last_beat != beat:
+                    continue
+                self.pending_stack = stack
+
+            logger.warning('GUI event loop stalled >= %.0f ms in %s\n%s',
+                           blocked * 1000, self.stall_location(stack), self.format_stack(stack))
+
+
+    def record_stall(self, duration, stack):
+        location = self.stall_location(stack)
+
+        self.stall_count += 1
+        self.total_stalled += duration
+        self.worst_stall = max(self.worst_stall, duration)
+        self.histogram[bisect.bisect_right(self.bounds_ms, duration * 1000)] += 1
+        count, total, worst = self.by_location.get(location, (0, 0, 0))
+        self.by_location[location] = (count + 1, total + duration, max(worst, duration))
+
+        # the stack was already logged by the monitor thread when it was captured
+        if stack:
+            logger.warning('GUI event loop stalled for %.0f ms in %s', duration * 1000, location)
+        else:
+            logger.warning('GUI event loop stalled for %.0f ms in %s\n%s',
+                           duration * 1000, location, self.format_stack(stack))
+
+
+    @staticmethod
+    def format_stack(stack) -> str:
+        if not stack:
+            return '  (stack not captured)\n'
+        return ''.join(traceback.format_list(stack))
+
+
+    @staticmethod
+    def stall_location(stack) -> str:
+        """
+        returns the innermost frame of this program in the captured stack,
+        falling back to the innermost frame if none is found.
+        """
+        if not stack:
+            return '<unknown>'
+        this_file = os.path.basename(__file__)
+        frame = stack[-1]
+        for summary in reversed(stack):
+            if os.path.basename(summary.filename) == this_file:
+                frame = summary
+                break
+        return f'{frame.name} ({os.path.basename(frame.filename)}:{frame.lineno})'
+
+
+    def summary(self) -> str:
+        """
+        returns a plain text summary of the stalls seen so far - a duration
+        histogram and the locations ranked by total time blocked.
+        """
+        threshold_ms = self.threshold * 1000
+        if not self.stall_count:
+            return f'No stalls over {threshold_ms:.0f} ms recorded.'
+
+        lines = [f'Stalls over {threshold_ms:.0f} ms: {self.stall_count}',
+                 f'Total blocked: {self.total_stalled * 1000:.0f} ms, worst: {self.worst_stall * 1000:.0f} ms',
+                 '',
+                 'Duration histogram:']
+
+        lower_bounds = [threshold_ms] + self.bounds_ms
+        # bars are scaled to at most 40 characters
+        scale = max(1, max(self.histogram) / 40)
+        for num, count in enumerate(self.histogram):
+            if num < len(self.bounds_ms):
+                label = f'{lower_bounds[num]:.0f}-{self.bounds_ms[num]:.0f} ms'
+            else:
+                label = f'>= {lower_bounds[num]:.0f} ms'
+            lines.append(f'  {label:>16} | {"#" * round(count / scale)} {count}')
+
+        ranked = sorted(self.by_location.items(), key=lambda item: item[1][1], reverse=True)
+
+        lines.append('')
+        lines.append('Worst locations (by total time blocked):')
+        for location, (count, total, worst) in ranked[:10]:
+            lines.append(f'  {total * 1000:7.0f} ms  x{count:<3} worst {worst * 1000:.0f} ms  {location}')
+        return '\n'.join(lines)
+
+
+############################ FUNCTIONS ############################
+
+
+def wifi_qr_security(auth, psk):
+    """
+    maps the auth reported by wifipasswords to the T: field of a WIFI: QR code.\n
+    returns a tuple of (security, reason). security is None for networks that
+    cannot be joined from a QR code, with the reason it cannot be shared.
+    """
+    auth_lower = auth.strip().lower()
+    if 'enterprise' in auth_lower or 'eap' in auth_lower or '802.1x' in auth_lower:
+        return None, f'{auth.strip()} networks use per user credentials and cannot be shared as a QR code.'
+    if auth_lower in ('open', 'none'):
+        return 'nopass', None
+    # an unknown auth with no key may still be secured, e.g. keychain access denied on macos
+    if not psk.strip():
+        return None, 'No password is stored for this network, so it cannot be shared as a QR code.'
+    if 'wep' in auth_lower:
+        return 'WEP', None
+    # macos does not report the auth, so an empty auth with a key is assumed to be WPA
+    return 'WPA', None
+
+
+def wifi_qr_payload(network, auth, psk):
+    """
+    returns the WIFI:T:..;S:..;P:..;; payload for a network, or None if the
+    network cannot be shared as a QR code.
+    """
+    security, _ = wifi_qr_security(auth, psk)
+    if security is None:
+        return None
+
+    def escape(value):
+        for char in '\\;,:"':
+            value = value.replace(char, '\\' + char)
+        return value
+
+    if security == 'nopass':
+        return f'WIFI:T:nopass;S:{escape(network)};;'
+    return f'WIFI:T:{security};S:{escape(network)};P:{escape(psk)};;'
+
+
+def qr_image(payload, size) -> QImage:
+    """
+    renders the payload as a black on white QR code with a 4 module quiet zone.\n
+    modules are scaled by a whole number of pixels so the image is at most size
+    pixels square. safe to call outside of the GUI thread.
+    """
+    matrix = qrencoder.encode(payload)
+    border = 4
+    modules = len(matrix) + border * 2
+
+    image = QImage(modules, modules, QImage.Format_RGB32)
+    image.fill(Qt.white)
+    for y, row in enumerate(matrix):
+        for x, dark in enumerate(row):
+            if dark:
+                image.setPixel(x + border, y + border, 0xFF000000)
+
+    scale = max(1, size // modules)
+    return image.scaled(modules * scale, modules * scale, Qt.IgnoreAspectRatio, Qt.FastTransformation)
+
+
+def render_share_card(network, values, width=1000, height=1300):
+    """
+    renders a printable share card with the network name, QR code and password.\n
+    returns None if the network cannot be shared. safe to call outside of the GUI thread.
+    """
+    payload = wifi_qr_payload(network, values['auth'], values['psk'])
+    if payload is None:
+        return None
+
+    card = QImage(width, height, QImage.Format_RGB32)
+    card.fill(Qt.white)
+    margin = width // 25
+
+    painter = QPainter(card)
+    painter.setPen(QPen(Qt.black, 4))
+    painter.drawRect(2, 2, width - 5, height - 5)
+
+    font = QFont()
+    font.setPixelSize(width // 18)
+    font.setBold(True)
+    painter.setFont(font)
+    title = painter.fontMetrics().elidedText(network, Qt.ElideRight, width - margin * 2)
+    painter.drawText(QRect(margin, margin, width - margin * 2, width // 10), Qt.AlignCenter, title)
+
+    qr = qr_image(payload, width - margin * 4)
+    qr_top = margin + width // 10
+    painter.drawImage((width - qr.width()) // 2, qr_top, qr)
+
+    font.setPixelSize(width // 25)
+    font.setBold(False)
+    painter.setFont(font)
+    text_top = qr_top + qr.width() + margin
+    painter.drawText(QRect(margin, text_top, width - margin * 2, height - text_top - margin),
+                     Qt.AlignHCenter | Qt.AlignTop | Qt.TextWrapAnywhere,
+                     f'Security: {values["auth"].strip() or "Unknown"}\nPassword: {values["psk"]}')
+    painter.end()
+    return card
+
+
+def write_share_cards_pdf(path, cards, columns=2, rows=2) -> bool:
+    """
+    lays out the rendered share cards on A4 pages and saves them as a PDF.\n
+    returns False if the file could not be written.
+    """
+    writer = QPdfWriter(path)
+    writer.setPageSize(QPageSize(QPageSize.A4))
+    writer.setResolution(300)
+    writer.setTitle('WiFi share cards')
+
+    painter = QPainter(writer)
+    if not painter.isActive():
+        return False
+    cell_width = writer.width() // columns
+    cell_height = writer.height() // rows
+    padding = 40
+    for num, card in enumerate(cards):
+        position = num % (columns * rows)
+        if num and position == 0:
+            writer.newPage()
+        target = card.size().scaled(cell_width - padding * 2, cell_height - padding * 2, Qt.KeepAspectRatio)
+        x = (position % columns) * cell_width + (cell_width - target.width()) // 2
+        y = (position // columns) * cell_height + (cell_height - target.height()) // 2
+        painter.drawImage(QRect(x, y, target.width(), target.height()), card)
+    return painter.end()
+
+
 ############################ MAIN APPLICATON ############################
 
 
@@ -677,6 +1213,15 @@ def resource_path(relative_path):
 if __name__ == "__main__":
     wifipw = WifiPasswords()    
     app = QApplication([])
-    gui = WifiPasswordsGUI()
+
+    # opt-in event loop stall detection, stalls are logged to stderr
+    watchdog = None
+    if '--watchdog' in sys.argv:
+        logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+        watchdog = EventLoopWatchdog()
+
+    gui = WifiPasswordsGUI(watchdog=watchdog)
     gui.show()
+    if watchdog is not None:
+        watchdog.start()
     sys.exit(app.exec_())